@@ -12,6 +12,19 @@ from ..value_objects.example import Example
 class Problem:
     """Represents a coding problem from any platform"""
 
+    __slots__ = (
+        "id",
+        "platform",
+        "title",
+        "difficulty",
+        "description",
+        "topics",
+        "constraints",
+        "examples",
+        "hints",
+        "acceptance_rate",
+    )
+
     id: str
     platform: str
     title: str
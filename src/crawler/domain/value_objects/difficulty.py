@@ -17,6 +17,19 @@ class Difficulty:
                 f"Invalid difficulty: {self.level}. " f"Must be one of {self.VALID_LEVELS}"
             )
 
+    @classmethod
+    def get(cls, level: str) -> "Difficulty":
+        """Return a cached Difficulty for the given level.
+
+        With only three valid levels, instances are flyweights: validation
+        runs once per level and callers share the cached object. Equality
+        stays value-based, so Difficulty.get("Easy") == Difficulty("Easy").
+        """
+        cached = _CACHE.get(level)
+        if cached is None:
+            cached = _CACHE.setdefault(level, cls(level))
+        return cached
+
     def is_easy(self) -> bool:
         """Check if difficulty is Easy"""
         return self.level == "Easy"
@@ -28,3 +41,7 @@ class Difficulty:
     def is_hard(self) -> bool:
         """Check if difficulty is Hard"""
         return self.level == "Hard"
+
+
+# Flyweight cache keyed by level, shared by Difficulty.get()
+_CACHE = {}
@@ -7,6 +7,8 @@ from dataclasses import dataclass
 class Percentiles:
     """Immutable performance percentiles for runtime and memory"""
 
+    __slots__ = ("runtime", "memory")
+
     runtime: float
     memory: float
 
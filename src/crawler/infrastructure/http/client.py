@@ -11,6 +11,7 @@ from logging import Logger
 from typing import Any, Dict, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from ...domain.exceptions import NetworkException
 from .rate_limiter import RateLimiter
@@ -38,18 +39,52 @@ class HTTPClient:
         >>> response = client.get("https://api.example.com/data")
     """
 
-    def __init__(self, retry_config: RetryConfig, rate_limiter: RateLimiter, logger: Logger):
+    def __init__(
+        self,
+        retry_config: RetryConfig,
+        rate_limiter: RateLimiter,
+        logger: Logger,
+        session: Optional[requests.Session] = None,
+    ):
         """Initialize the HTTP client.
 
         Args:
             retry_config: Configuration for retry behavior
             rate_limiter: Rate limiter for controlling request rate
             logger: Logger for tracking requests and errors
+            session: Optional shared requests session; a new one is created
+                     when omitted
         """
         self.retry_config = retry_config
         self.rate_limiter = rate_limiter
         self.logger = logger
-        self.session = requests.Session()
+
+        # The config is frozen, so its scalars can be copied onto the
+        # client once and read without the per-retry attribute chain
+        self._max_retries = retry_config.max_retries
+        self._jitter = retry_config.jitter
+
+        if session is None:
+            session = requests.Session()
+            # Widen the connection pool so concurrent crawls reuse keep-alive
+            # sockets instead of re-handshaking TLS per request. Adapter-level
+            # retries stay off; our own retry loop owns that behavior. A
+            # caller-provided session is left untouched: mounting here would
+            # replace its adapters and throw away their warm pools.
+            adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+
+        # Backoff schedule precomputed from the config so each retry is a
+        # table lookup; attempts beyond the table clamp to max_delay
+        self._delays = tuple(
+            min(
+                retry_config.max_delay,
+                retry_config.initial_delay * (retry_config.exponential_base**attempt),
+            )
+            for attempt in range(64)
+        )
 
     def post(
         self,
@@ -117,21 +152,19 @@ class HTTPClient:
         """
         last_exception = None
 
-        for attempt in range(self.retry_config.max_retries):
+        for attempt in range(self._max_retries):
             try:
                 # Apply rate limiting
                 self.rate_limiter.acquire()
 
                 # Make request
-                self.logger.debug(
-                    f"Attempt {attempt + 1}/{self.retry_config.max_retries}: {method} {url}"
-                )
+                self.logger.debug(f"Attempt {attempt + 1}/{self._max_retries}: {method} {url}")
                 response = self.session.request(method, url, **kwargs)
 
                 # Check for HTTP errors
                 # Special handling for 429 (Too Many Requests) and 403 (Forbidden - often rate limiting)
                 if response.status_code in [429, 403]:
-                    if attempt < self.retry_config.max_retries - 1:
+                    if attempt < self._max_retries - 1:
                         # Use longer delay for rate limiting
                         delay = (
                             self._calculate_delay(attempt) * 2
@@ -181,11 +214,11 @@ class HTTPClient:
                 # For 5xx errors or unknown errors, continue to retry logic below
                 last_exception = e
                 self.logger.warning(
-                    f"Request failed (attempt {attempt + 1}/{self.retry_config.max_retries}): {e}"
+                    f"Request failed (attempt {attempt + 1}/{self._max_retries}): {e}"
                 )
 
                 # Don't retry if this was the last attempt
-                if attempt < self.retry_config.max_retries - 1:
+                if attempt < self._max_retries - 1:
                     delay = self._calculate_delay(attempt)
                     self.logger.info(f"Retrying in {delay:.2f} seconds...")
                     time.sleep(delay)
@@ -193,17 +226,17 @@ class HTTPClient:
             except requests.exceptions.RequestException as e:
                 last_exception = e
                 self.logger.warning(
-                    f"Request failed (attempt {attempt + 1}/{self.retry_config.max_retries}): {e}"
+                    f"Request failed (attempt {attempt + 1}/{self._max_retries}): {e}"
                 )
 
                 # Don't retry if this was the last attempt
-                if attempt < self.retry_config.max_retries - 1:
+                if attempt < self._max_retries - 1:
                     delay = self._calculate_delay(attempt)
                     self.logger.info(f"Retrying in {delay:.2f} seconds...")
                     time.sleep(delay)
 
         # All retries exhausted
-        error_msg = f"Request failed after {self.retry_config.max_retries} attempts"
+        error_msg = f"Request failed after {self._max_retries} attempts"
         self.logger.error(f"{error_msg}: {last_exception}")
 
         # Extract status code if available
@@ -229,14 +262,11 @@ class HTTPClient:
         Returns:
             The delay in seconds
         """
-        # Calculate exponential backoff
-        delay = min(
-            self.retry_config.initial_delay * (self.retry_config.exponential_base**attempt),
-            self.retry_config.max_delay,
-        )
+        # Look up the precomputed exponential backoff schedule
+        delay = self._delays[attempt if attempt < 63 else 63]
 
         # Add jitter if enabled
-        if self.retry_config.jitter:
+        if self._jitter:
             # Random factor between 0.5 and 1.0
             delay *= 0.5 + random.random() * 0.5
 
@@ -8,6 +8,10 @@ of operations using the token bucket algorithm.
 import threading
 import time
 
+# Tokens are tracked as integers scaled by 1e9 ("nanotokens") so refill
+# arithmetic uses the drift-free monotonic_ns clock with no float error
+_NS_PER_SECOND = 1_000_000_000
+
 
 class RateLimiter:
     """Token bucket rate limiter for controlling request rates.
@@ -44,10 +48,21 @@ class RateLimiter:
             raise ValueError("requests_per_second must be positive")
 
         self.requests_per_second = requests_per_second
-        self.tokens = requests_per_second
-        self.last_update = time.time()
+        self._max_tokens_scaled = int(requests_per_second * _NS_PER_SECOND)
+        self._tokens_scaled = self._max_tokens_scaled
+        self._last_ns = time.monotonic_ns()
         self.lock = threading.Lock()
 
+    @property
+    def tokens(self) -> float:
+        """Current number of available tokens (derived from integer state)."""
+        return self._tokens_scaled / _NS_PER_SECOND
+
+    @property
+    def last_update(self) -> float:
+        """Timestamp of last token refill, in monotonic-clock seconds."""
+        return self._last_ns / _NS_PER_SECOND
+
     def acquire(self) -> None:
         """Acquire a token, blocking if necessary.
 
@@ -57,20 +72,38 @@ class RateLimiter:
         The method is thread-safe and can be called from multiple threads
         simultaneously.
         """
-        with self.lock:
-            now = time.time()
-            elapsed = now - self.last_update
+        # Fast path: grab the lock without blocking when it is free (the
+        # common uncontended case); fall back to a blocking acquire only
+        # when another thread holds it
+        if self.lock.acquire(blocking=False):
+            try:
+                self._acquire_locked()
+            finally:
+                self.lock.release()
+            return
 
-            # Refill tokens based on elapsed time
-            self.tokens = min(
-                self.requests_per_second, self.tokens + elapsed * self.requests_per_second
+        with self.lock:
+            self._acquire_locked()
+
+    def _acquire_locked(self) -> None:
+        """Refill and consume one token. Caller must hold the lock."""
+        now = time.monotonic_ns()
+        elapsed_ns = now - self._last_ns
+
+        # Refill tokens based on elapsed time (integer nanotoken math;
+        # elapsed_ns * rate is nanotokens directly)
+        self._tokens_scaled = min(
+            self._max_tokens_scaled,
+            self._tokens_scaled + int(elapsed_ns * self.requests_per_second),
+        )
+        self._last_ns = now
+
+        # Wait if no tokens available
+        if self._tokens_scaled < _NS_PER_SECOND:
+            sleep_time = (_NS_PER_SECOND - self._tokens_scaled) / (
+                self.requests_per_second * _NS_PER_SECOND
             )
-            self.last_update = now
-
-            # Wait if no tokens available
-            if self.tokens < 1:
-                sleep_time = (1 - self.tokens) / self.requests_per_second
-                time.sleep(sleep_time)
-                self.tokens = 0
-            else:
-                self.tokens -= 1
+            time.sleep(sleep_time)
+            self._tokens_scaled = 0
+        else:
+            self._tokens_scaled -= _NS_PER_SECOND
@@ -8,9 +8,9 @@ exponential backoff parameters and jitter settings.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class RetryConfig:
-    """Configuration for retry behavior with exponential backoff.
+    """Immutable configuration for retry behavior with exponential backoff.
 
     Attributes:
         max_retries: Maximum number of retry attempts (default: 3)
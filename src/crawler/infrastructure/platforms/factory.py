@@ -31,7 +31,7 @@ class PlatformClientFactory:
     Future platforms can be added by:
     1. Implementing the PlatformClient interface
     2. Creating a platform-specific adapter
-    3. Adding a new elif branch in the create() method
+    3. Registering (client class, adapter class) in the _registry table
 
     Attributes:
         http_client: HTTP client with retry and rate limiting
@@ -53,6 +53,17 @@ class PlatformClientFactory:
         >>> problem = leetcode_client.fetch_problem("two-sum")
     """
 
+    # Platform identifier -> (client class, adapter class). Dict dispatch
+    # keeps create() O(1) and lets new platforms register without edits
+    # to the method body.
+    _registry = {
+        "leetcode": (LeetCodeClient, LeetCodeAdapter),
+        # Future platforms can be added here:
+        # "hackerrank": (HackerRankClient, HackerRankAdapter),
+        # "codechef": (CodeChefClient, CodeChefAdapter),
+        # "codeforces": (CodeforcesClient, CodeforcesAdapter),
+    }
+
     def __init__(self, http_client: HTTPClient, config: Config, logger: Logger):
         """Initialize the platform client factory.
 
@@ -94,37 +105,11 @@ class PlatformClientFactory:
         """
         platform = platform.lower()
 
-        if platform == "leetcode":
-            self.logger.info(f"Creating LeetCode client")
-            adapter = LeetCodeAdapter()
-            return LeetCodeClient(self.http_client, adapter, self.config, self.logger)
-
-        # Future platforms can be added here:
-        # elif platform == "hackerrank":
-        #     adapter = HackerRankAdapter()
-        #     return HackerRankClient(
-        #         self.http_client,
-        #         adapter,
-        #         self.config,
-        #         self.logger
-        #     )
-        # elif platform == "codechef":
-        #     adapter = CodeChefAdapter()
-        #     return CodeChefClient(
-        #         self.http_client,
-        #         adapter,
-        #         self.config,
-        #         self.logger
-        #     )
-        # elif platform == "codeforces":
-        #     adapter = CodeforcesAdapter()
-        #     return CodeforcesClient(
-        #         self.http_client,
-        #         adapter,
-        #         self.config,
-        #         self.logger
-        #     )
-
-        else:
+        entry = self._registry.get(platform)
+        if entry is None:
             self.logger.error(f"Unsupported platform requested: {platform}")
             raise UnsupportedPlatformException(platform)
+
+        client_class, adapter_class = entry
+        self.logger.info(f"Creating {platform} client")
+        return client_class(self.http_client, adapter_class(), self.config, self.logger)
@@ -1,11 +1,17 @@
 """LeetCode adapter for converting API responses to domain models."""
 
-import json
 import logging
 import re
+from html import unescape
+from sys import intern as _intern
 from typing import Any, Dict, List
 
-from bs4 import BeautifulSoup
+try:
+    # orjson parses small JSON blobs several times faster than the stdlib;
+    # fall back transparently when it is not installed
+    import orjson as _json
+except ImportError:  # pragma: no cover
+    import json as _json  # type: ignore[no-redef]
 
 from crawler.domain.entities import Problem, Submission
 from crawler.domain.entities.enums import SubmissionStatus
@@ -14,6 +20,55 @@ from crawler.domain.value_objects import Constraint, Difficulty, Example, Percen
 # Configure logger for this module
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for HTML-to-text conversion. A single regex pass
+# strips comments and tags without building a parse tree, which is far
+# cheaper than BeautifulSoup for the flat markup LeetCode returns.
+_TAG_RE = re.compile(r"<!--[\s\S]*?-->|<[^>]+>")
+# Translate exotic inline whitespace to plain spaces in one C-level pass,
+# leaving newlines intact; runs of spaces are then collapsed per line
+_WS_TABLE = str.maketrans("\t\f\v\r", "    ")
+_SPACE_RUN_RE = re.compile(" {2,}")
+# Matches non-empty line content; findall skips blank-line runs in C
+# instead of split("\n") producing empty strings to filter in Python
+_LINE_RE = re.compile(r"[^\r\n]+")
+# Fast path for well-formed stats blobs: pull the acceptance rate straight
+# out of the string without invoking the JSON machinery
+_AC_RATE_RE = re.compile(r'"acRate"\s*:\s*"([\d.]+)%"')
+
+# Description-splitting and example/constraint parsing patterns, compiled
+# once at import so no method pays re-cache lookups on the hot path
+_EXAMPLE_START_RE = re.compile(r"\bExample\s+1:")
+_CONSTRAINTS_START_RE = re.compile(r"\bConstraints?:", re.IGNORECASE)
+_CONSTRAINTS_PREFIX_RE = re.compile(r"^Constraints?:\s*", re.IGNORECASE)
+_FOLLOW_UP_RE = re.compile(r"\bFollow-?up:", re.IGNORECASE)
+_EXAMPLE_BLOCK_SPLIT_RE = re.compile(r"(?=\bExample(?:\s+\d+)?:)")
+_EXAMPLE_PREFIX_RE = re.compile(r"^\bExample(?:\s+\d+)?:\s*", re.IGNORECASE)
+_EXAMPLE_INPUT_RE = re.compile(
+    r"Input:\s*(.+?)(?=\s*(?:Output:|Explanation:|Example(?:\s+\d+)?:|$))",
+    re.DOTALL | re.IGNORECASE,
+)
+_EXAMPLE_OUTPUT_RE = re.compile(
+    r"Output:\s*(.+?)(?=\s*(?:Explanation:|Example(?:\s+\d+)?:|$))",
+    re.DOTALL | re.IGNORECASE,
+)
+_EXAMPLE_EXPLANATION_RE = re.compile(
+    r"Explanation:\s*(.+?)(?=\s*(?:Example(?:\s+\d+)?:|$))",
+    re.DOTALL | re.IGNORECASE,
+)
+_BULLET_PREFIX_RE = re.compile(r"^[•\-\*]\s+")
+_NUMBERED_PREFIX_RE = re.compile(r"^\d+\.\s+")
+
+# LeetCode submission status strings mapped to our enum. Built once at
+# import so _map_submission_status is a single dict lookup per call.
+_STATUS_MAP = {
+    "Accepted": SubmissionStatus.ACCEPTED,
+    "Wrong Answer": SubmissionStatus.WRONG_ANSWER,
+    "Time Limit Exceeded": SubmissionStatus.TIME_LIMIT_EXCEEDED,
+    "Memory Limit Exceeded": SubmissionStatus.MEMORY_LIMIT_EXCEEDED,
+    "Runtime Error": SubmissionStatus.RUNTIME_ERROR,
+    "Compile Error": SubmissionStatus.COMPILE_ERROR,
+}
+
 
 class LeetCodeAdapter:
     """Adapts LeetCode API responses to domain models.
@@ -63,8 +118,10 @@ class LeetCodeAdapter:
         # Parse acceptance rate from stats JSON
         acceptance_rate = self._parse_acceptance_rate(question.get("stats", "{}"))
 
-        # Extract topic tags
-        topics = [tag["name"] for tag in question.get("topicTags", [])]
+        # Extract topic tags, interning the names: the same small set of
+        # tags repeats across every problem in a bulk crawl, so interned
+        # copies share storage and compare by pointer
+        topics = [_intern(tag["name"]) for tag in question.get("topicTags", [])]
 
         # Get hints (may be empty list)
         hints = question.get("hints", [])
@@ -73,7 +130,7 @@ class LeetCodeAdapter:
             id=question["titleSlug"],
             platform="leetcode",
             title=question["title"],
-            difficulty=Difficulty(question["difficulty"]),
+            difficulty=Difficulty.get(question["difficulty"]),
             description=parsed["description"],
             topics=topics,
             constraints=parsed["constraints"],
@@ -102,8 +159,9 @@ class LeetCodeAdapter:
         # Parse acceptance rate (comes as percentage string like "49.1")
         ac_rate = float(question_data.get("acRate", 0.0))
 
-        # Extract topic tags
-        topics = [tag["name"] for tag in question_data.get("topicTags", [])]
+        # Extract topic tags (interned; the tag vocabulary is small and
+        # repeats across the whole problem list)
+        topics = [_intern(tag["name"]) for tag in question_data.get("topicTags", [])]
 
         # Create a minimal Problem entity with available data
         # Description, examples, constraints, and hints are not available in list view
@@ -111,7 +169,7 @@ class LeetCodeAdapter:
             id=question_data["titleSlug"],
             platform="leetcode",
             title=question_data["title"],
-            difficulty=Difficulty(question_data["difficulty"]),
+            difficulty=Difficulty.get(question_data["difficulty"]),
             description="",  # Not available in list view
             topics=topics,
             constraints=[],  # Not available in list view
@@ -157,7 +215,7 @@ class LeetCodeAdapter:
         return Submission(
             id=details["id"],
             problem_id=problem_id,
-            language=details["langName"],
+            language=_intern(details["langName"]),
             code=details["code"],
             status=status,
             runtime=details["runtime"],
@@ -169,8 +227,8 @@ class LeetCodeAdapter:
     def _parse_html(self, html: str) -> str:
         """Extract plain text from HTML content.
 
-        Uses BeautifulSoup to parse HTML and extract text content,
-        removing all HTML tags while preserving line breaks.
+        Uses precompiled regexes to strip HTML tags and decode entities,
+        removing all markup while preserving line breaks.
 
         Args:
             html: HTML string to parse
@@ -186,21 +244,20 @@ class LeetCodeAdapter:
         if not html:
             return ""
 
-        # Parse HTML with BeautifulSoup
-        soup = BeautifulSoup(html, "html.parser")
-
-        # Extract text content
-        text = soup.get_text()
+        if "<" not in html and "&" not in html:
+            # No markup or entities at all (a C-level memchr check), so
+            # skip tag stripping and entity decoding entirely
+            text = html.translate(_WS_TABLE)
+        else:
+            # Strip comments and tags first, then decode entities so literal
+            # "&lt;" in constraint text is not re-interpreted as markup
+            text = unescape(_TAG_RE.sub("", html)).translate(_WS_TABLE)
 
         # Clean up whitespace while preserving newlines
         # Replace multiple spaces (but not newlines) with single space
-        lines = text.split("\n")
-        cleaned_lines = [re.sub(r"[ \t]+", " ", line.strip()) for line in lines]
+        cleaned_lines = (_SPACE_RUN_RE.sub(" ", line.strip()) for line in _LINE_RE.findall(text))
         text = "\n".join(line for line in cleaned_lines if line)
 
-        # Strip leading/trailing whitespace
-        text = text.strip()
-
         return text
 
     def _extract_description_parts(self, full_text: str) -> Dict[str, Any]:
@@ -231,8 +288,8 @@ class LeetCodeAdapter:
             1
         """
         # Find where examples start
-        example_match = re.search(r"\bExample\s+1:", full_text)
-        constraints_match = re.search(r"\bConstraints?:", full_text, re.IGNORECASE)
+        example_match = _EXAMPLE_START_RE.search(full_text)
+        constraints_match = _CONSTRAINTS_START_RE.search(full_text)
 
         # Extract main description (before examples)
         if example_match:
@@ -266,12 +323,10 @@ class LeetCodeAdapter:
                 constraints_text = full_text[constraints_match.start() :]
 
                 # Remove "Constraints:" prefix
-                constraints_text = re.sub(
-                    r"^Constraints?:\s*", "", constraints_text, flags=re.IGNORECASE
-                )
+                constraints_text = _CONSTRAINTS_PREFIX_RE.sub("", constraints_text)
 
                 # Remove "Follow-up:" and everything after it
-                follow_up_match = re.search(r"\bFollow-?up:", constraints_text, re.IGNORECASE)
+                follow_up_match = _FOLLOW_UP_RE.search(constraints_text)
                 if follow_up_match:
                     constraints_text = constraints_text[: follow_up_match.start()]
 
@@ -323,14 +378,14 @@ class LeetCodeAdapter:
 
             # Split by "Example N:" or "Example:" pattern (handles both numbered and unnumbered)
             # Use lookahead to keep the delimiter for better error messages
-            example_blocks = re.split(r"(?=\bExample(?:\s+\d+)?:)", examples_text)
+            example_blocks = _EXAMPLE_BLOCK_SPLIT_RE.split(examples_text)
 
             for block_idx, block in enumerate(example_blocks):
                 if not block.strip():
                     continue
 
                 # Remove the "Example N:" or "Example:" prefix for cleaner processing
-                block_content = re.sub(r"^\bExample(?:\s+\d+)?:\s*", "", block, flags=re.IGNORECASE)
+                block_content = _EXAMPLE_PREFIX_RE.sub("", block)
 
                 if not block_content.strip():
                     continue
@@ -339,21 +394,9 @@ class LeetCodeAdapter:
                     # Extract Input, Output, and Explanation
                     # Use DOTALL to handle multi-line content
                     # Use non-greedy matching to stop at the next field
-                    input_match = re.search(
-                        r"Input:\s*(.+?)(?=\s*(?:Output:|Explanation:|Example(?:\s+\d+)?:|$))",
-                        block_content,
-                        re.DOTALL | re.IGNORECASE,
-                    )
-                    output_match = re.search(
-                        r"Output:\s*(.+?)(?=\s*(?:Explanation:|Example(?:\s+\d+)?:|$))",
-                        block_content,
-                        re.DOTALL | re.IGNORECASE,
-                    )
-                    explanation_match = re.search(
-                        r"Explanation:\s*(.+?)(?=\s*(?:Example(?:\s+\d+)?:|$))",
-                        block_content,
-                        re.DOTALL | re.IGNORECASE,
-                    )
+                    input_match = _EXAMPLE_INPUT_RE.search(block_content)
+                    output_match = _EXAMPLE_OUTPUT_RE.search(block_content)
+                    explanation_match = _EXAMPLE_EXPLANATION_RE.search(block_content)
 
                     # Validate that we have both Input and Output
                     if not input_match or not output_match:
@@ -430,8 +473,7 @@ class LeetCodeAdapter:
             constraints = []
 
             # Strategy 1: Split by newlines (most common format)
-            lines = constraints_text.split("\n")
-            for line in lines:
+            for line in _LINE_RE.findall(constraints_text):
                 cleaned = self._clean_constraint_text(line)
                 if cleaned:
                     try:
@@ -502,10 +544,10 @@ class LeetCodeAdapter:
         cleaned = text.strip()
 
         # Remove bullet point markers at the start
-        cleaned = re.sub(r"^[•\-\*]\s+", "", cleaned)
+        cleaned = _BULLET_PREFIX_RE.sub("", cleaned)
 
         # Remove numbered list markers at the start (e.g., "1. ", "2. ")
-        cleaned = re.sub(r"^\d+\.\s+", "", cleaned)
+        cleaned = _NUMBERED_PREFIX_RE.sub("", cleaned)
 
         # Remove trailing period if present
         # Only remove if it's the very last character after stripping
@@ -531,15 +573,26 @@ class LeetCodeAdapter:
         if not stats_json:
             return 0.0
 
+        # Common case: extract the rate with one regex search and skip the
+        # full JSON parse entirely
+        match = _AC_RATE_RE.search(stats_json)
+        if match:
+            try:
+                return float(match.group(1))
+            except ValueError:
+                pass
+
         try:
-            stats = json.loads(stats_json)
+            stats = _json.loads(stats_json)
             ac_rate_str = stats.get("acRate", "0%")
 
             # Remove '%' and convert to float
             ac_rate = float(ac_rate_str.rstrip("%"))
 
             return ac_rate
-        except (json.JSONDecodeError, ValueError, KeyError):
+        except (ValueError, KeyError):
+            # Covers both json.JSONDecodeError and orjson.JSONDecodeError,
+            # which subclass ValueError
             return 0.0
 
     def _map_submission_status(self, status_display: str) -> SubmissionStatus:
@@ -555,13 +608,4 @@ class LeetCodeAdapter:
             >>> adapter._map_submission_status("Accepted")
             SubmissionStatus.ACCEPTED
         """
-        status_map = {
-            "Accepted": SubmissionStatus.ACCEPTED,
-            "Wrong Answer": SubmissionStatus.WRONG_ANSWER,
-            "Time Limit Exceeded": SubmissionStatus.TIME_LIMIT_EXCEEDED,
-            "Memory Limit Exceeded": SubmissionStatus.MEMORY_LIMIT_EXCEEDED,
-            "Runtime Error": SubmissionStatus.RUNTIME_ERROR,
-            "Compile Error": SubmissionStatus.COMPILE_ERROR,
-        }
-
-        return status_map.get(status_display, SubmissionStatus.RUNTIME_ERROR)
+        return _STATUS_MAP.get(status_display, SubmissionStatus.RUNTIME_ERROR)
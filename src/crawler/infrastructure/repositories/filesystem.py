@@ -1,10 +1,23 @@
 """File system-based problem repository implementation."""
 
 import json
+import mmap
+import os
+import shutil
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
 from logging import Logger
 from pathlib import Path
 from typing import List, Optional
 
+try:
+    # orjson serializes several times faster than the stdlib and works on
+    # bytes end to end; fall back transparently when it is not installed
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 from crawler.application.interfaces.formatter import OutputFormatter
 from crawler.application.interfaces.repository import ProblemRepository
 from crawler.domain.entities import Problem, Submission
@@ -12,6 +25,62 @@ from crawler.domain.entities.enums import SubmissionStatus
 from crawler.domain.exceptions import RepositoryException
 from crawler.domain.value_objects import Constraint, Difficulty, Example, Percentiles
 
+# Upper bound on deserialized problems kept in the per-repository cache
+_CACHE_MAX_ENTRIES = 512
+
+if orjson is not None:
+
+    def _dumps(data: dict) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+else:  # pragma: no cover
+
+    def _dumps(data: dict) -> bytes:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+    _loads = json.loads
+
+
+def _atomic_write_bytes(path: str, data: bytes) -> None:
+    """Write bytes to path via a temp file and rename.
+
+    The replace is atomic, so readers never observe a partially written
+    file, and the raw os calls skip Path/TextIO layering.
+    """
+    tmp_path = path + ".tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
+def _read_and_parse(path: str) -> dict:
+    """Read and JSON-parse one metadata file (thread-pool worker).
+
+    The file is memory-mapped and handed to the parser as a buffer, so the
+    bytes are parsed straight out of the page cache without an intermediate
+    copy (orjson accepts memoryview; the stdlib fallback still copies).
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if size == 0:
+            # Mirror the empty-read error path; mmap rejects zero length
+            return _loads(b"")
+        with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                if orjson is not None:
+                    return orjson.loads(view)
+                return _loads(view.tobytes())
+            finally:
+                view.release()
+    finally:
+        os.close(fd)
+
 
 class FileSystemRepository(ProblemRepository):
     """
@@ -40,9 +109,24 @@ class FileSystemRepository(ProblemRepository):
             logger: Logger instance for logging operations
         """
         self.base_path = Path(base_path)
+        # Plain-string base for hot paths; os.path.join on str avoids the
+        # cost of constructing Path objects per lookup
+        self._base_str = str(self.base_path)
         self.formatter = formatter
+        # The extension is fixed per formatter, so resolve it once here
+        # rather than per save
+        self._ext = formatter.get_file_extension()
         self.logger = logger
 
+        # LRU of deserialized problems keyed by (id, platform, mtime_ns,
+        # size); a rewrite changes the key, so entries self-invalidate
+        self._cache: "OrderedDict[tuple, Problem]" = OrderedDict()
+
+        # Formatted-output cache: maps (platform, id) to the metadata bytes
+        # of the last save and the encoded solution produced for them, so
+        # re-saving an unchanged problem skips the formatter entirely
+        self._fmt_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
         # Ensure base path exists
         self.base_path.mkdir(parents=True, exist_ok=True)
 
@@ -67,17 +151,35 @@ class FileSystemRepository(ProblemRepository):
             problem_dir = self.base_path / problem.platform / problem.id
             problem_dir.mkdir(parents=True, exist_ok=True)
 
-            # Format and write the problem file
-            content = self.formatter.format_problem(problem, submission)
-            file_path = problem_dir / f"solution.{self.formatter.get_file_extension()}"
-            file_path.write_text(content, encoding="utf-8")
+            # Serialize metadata first: its bytes are a complete value
+            # snapshot of problem and submission, so they double as the
+            # cache key for the formatted output
+            metadata = self._serialize_problem(problem, submission)
+            metadata_bytes = _dumps(metadata)
+
+            # Reuse the previously formatted bytes when nothing changed
+            fmt_key = (problem.platform, problem.id)
+            cached = self._fmt_cache.get(fmt_key)
+            if cached is not None and cached[0] == metadata_bytes:
+                solution_bytes = cached[1]
+                self._fmt_cache.move_to_end(fmt_key)
+            else:
+                content = self.formatter.format_problem(problem, submission)
+                solution_bytes = content.encode("utf-8")
+                self._fmt_cache[fmt_key] = (metadata_bytes, solution_bytes)
+                if len(self._fmt_cache) > _CACHE_MAX_ENTRIES:
+                    self._fmt_cache.popitem(last=False)
+
+            # Write the problem file
+            file_path = problem_dir / f"solution.{self._ext}"
+            _atomic_write_bytes(str(file_path), solution_bytes)
 
             # Write metadata for reconstruction
-            metadata = self._serialize_problem(problem, submission)
             metadata_path = problem_dir / "metadata.json"
-            metadata_path.write_text(
-                json.dumps(metadata, indent=2, ensure_ascii=False), encoding="utf-8"
-            )
+            _atomic_write_bytes(str(metadata_path), metadata_bytes)
+
+            # Drop any cached copy so the next read reflects this write
+            self._invalidate_cache(problem.id, problem.platform)
 
             self.logger.info(f"Saved problem {problem.id} to {file_path}")
 
@@ -102,17 +204,31 @@ class FileSystemRepository(ProblemRepository):
             RepositoryException: If the retrieval operation fails
         """
         try:
-            problem_dir = self.base_path / platform / problem_id
-            metadata_path = problem_dir / "metadata.json"
+            metadata_path = os.path.join(self._base_str, platform, problem_id, "metadata.json")
 
-            if not metadata_path.exists():
+            # One stat doubles as the existence probe and the cache key
+            try:
+                stat = os.stat(metadata_path)
+            except FileNotFoundError:
                 return None
 
-            # Read and deserialize metadata
-            metadata_text = metadata_path.read_text(encoding="utf-8")
-            metadata = json.loads(metadata_text)
+            # Serve repeated lookups from the LRU; the stat result keys the
+            # entry so a modified file is a guaranteed miss
+            cache_key = (problem_id, platform, stat.st_mtime_ns, stat.st_size)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+                return cached
 
-            return self._deserialize_problem(metadata)
+            # Read and deserialize metadata (bytes all the way from disk)
+            with open(metadata_path, "rb") as metadata_file:
+                metadata = _loads(metadata_file.read())
+
+            problem = self._deserialize_problem(metadata)
+            self._cache[cache_key] = problem
+            if len(self._cache) > _CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+            return problem
 
         except json.JSONDecodeError as e:
             self.logger.error(f"Failed to parse metadata for {problem_id}: {e}")
@@ -134,9 +250,7 @@ class FileSystemRepository(ProblemRepository):
         Returns:
             bool: True if the problem exists, False otherwise
         """
-        problem_dir = self.base_path / platform / problem_id
-        metadata_path = problem_dir / "metadata.json"
-        return metadata_path.exists()
+        return os.path.isfile(os.path.join(self._base_str, platform, problem_id, "metadata.json"))
 
     def list_all(self, platform: Optional[str] = None) -> List[Problem]:
         """
@@ -155,29 +269,59 @@ class FileSystemRepository(ProblemRepository):
             RepositoryException: If the list operation fails
         """
         problems = []
+        base = str(self.base_path)
 
         try:
-            # Determine which platforms to scan
+            # Determine which platforms to scan. os.scandir yields DirEntry
+            # objects whose is_dir() results come from the directory read,
+            # avoiding an extra stat() per entry
             if platform:
                 platforms = [platform]
             else:
                 # List all platform directories
-                platforms = [p.name for p in self.base_path.iterdir() if p.is_dir()]
+                with os.scandir(base) as entries:
+                    platforms = [e.name for e in entries if e.is_dir(follow_symlinks=False)]
 
-            # Scan each platform directory
+            # Scan each platform directory, answering what we can from the
+            # LRU and queueing cache misses for parallel parsing
+            misses = []
             for plat in platforms:
-                platform_dir = self.base_path / plat
-                if not platform_dir.exists():
+                platform_dir = os.path.join(base, plat)
+                if not os.path.isdir(platform_dir):
                     continue
 
                 # Scan each problem directory
-                for problem_dir in platform_dir.iterdir():
-                    if not problem_dir.is_dir():
-                        continue
-
-                    # Try to load the problem
-                    problem = self.find_by_id(problem_dir.name, plat)
-                    if problem:
+                with os.scandir(platform_dir) as entries:
+                    for entry in entries:
+                        if not entry.is_dir(follow_symlinks=False):
+                            continue
+
+                        metadata_path = os.path.join(entry.path, "metadata.json")
+                        try:
+                            stat = os.stat(metadata_path)
+                        except FileNotFoundError:
+                            continue
+
+                        cache_key = (entry.name, plat, stat.st_mtime_ns, stat.st_size)
+                        cached = self._cache.get(cache_key)
+                        if cached is not None:
+                            self._cache.move_to_end(cache_key)
+                            problems.append(cached)
+                        else:
+                            misses.append((cache_key, metadata_path))
+
+            # Read and parse the misses on a thread pool: the reads block on
+            # disk and orjson releases the GIL while parsing, so the work
+            # overlaps. Deserialization and cache insertion stay on this
+            # thread.
+            if misses:
+                with ThreadPoolExecutor(max_workers=min(32, len(misses))) as executor:
+                    parsed = executor.map(_read_and_parse, [path for _, path in misses])
+                    for (cache_key, _), metadata in zip(misses, parsed):
+                        problem = self._deserialize_problem(metadata)
+                        self._cache[cache_key] = problem
+                        if len(self._cache) > _CACHE_MAX_ENTRIES:
+                            self._cache.popitem(last=False)
                         problems.append(problem)
 
             return problems
@@ -203,17 +347,15 @@ class FileSystemRepository(ProblemRepository):
             RepositoryException: If the delete operation fails
         """
         try:
-            problem_dir = self.base_path / platform / problem_id
+            problem_dir = os.path.join(self._base_str, platform, problem_id)
 
-            if not problem_dir.exists():
+            if not os.path.isdir(problem_dir):
                 return False
 
-            # Remove all files in the directory
-            for file_path in problem_dir.iterdir():
-                file_path.unlink()
+            # Remove the directory tree in one call
+            shutil.rmtree(problem_dir, ignore_errors=True)
 
-            # Remove the directory
-            problem_dir.rmdir()
+            self._invalidate_cache(problem_id, platform)
 
             self.logger.info(f"Deleted problem {problem_id} from {platform}")
             return True
@@ -222,6 +364,12 @@ class FileSystemRepository(ProblemRepository):
             self.logger.error(f"Failed to delete problem {problem_id}: {e}")
             raise RepositoryException(f"Failed to delete problem {problem_id}") from e
 
+    def _invalidate_cache(self, problem_id: str, platform: str) -> None:
+        """Remove any cached entries for the given problem."""
+        stale = [key for key in self._cache if key[0] == problem_id and key[1] == platform]
+        for key in stale:
+            del self._cache[key]
+
     def get_submission_timestamp(self, problem_id: str, platform: str) -> Optional[int]:
         """
         Get the timestamp of the stored submission for a problem.
@@ -241,15 +389,14 @@ class FileSystemRepository(ProblemRepository):
             RepositoryException: If the retrieval operation fails
         """
         try:
-            problem_dir = self.base_path / platform / problem_id
-            metadata_path = problem_dir / "metadata.json"
+            metadata_path = os.path.join(self._base_str, platform, problem_id, "metadata.json")
 
-            if not metadata_path.exists():
+            if not os.path.isfile(metadata_path):
                 return None
 
-            # Read and parse metadata
-            metadata_text = metadata_path.read_text(encoding="utf-8")
-            metadata = json.loads(metadata_text)
+            # Read and parse metadata (bytes all the way from disk)
+            with open(metadata_path, "rb") as metadata_file:
+                metadata = _loads(metadata_file.read())
 
             # Check if submission exists in metadata
             if "submission" in metadata and metadata["submission"]:
@@ -277,41 +424,17 @@ class FileSystemRepository(ProblemRepository):
         Returns:
             dict: Serialized problem data
         """
-        data = {
-            "id": problem.id,
-            "platform": problem.platform,
-            "title": problem.title,
-            "difficulty": problem.difficulty.level,
-            "description": problem.description,
-            "topics": problem.topics,
-            "constraints": [{"text": c.text} for c in problem.constraints],
-            "examples": [
-                {"input": ex.input, "output": ex.output, "explanation": ex.explanation}
-                for ex in problem.examples
-            ],
-            "hints": problem.hints,
-            "acceptance_rate": problem.acceptance_rate,
-        }
+        # dataclasses.asdict recurses through the nested value objects
+        # (Constraint, Example, Percentiles) and produces the stored
+        # metadata shape directly; only the non-dataclass leaves need
+        # adjusting afterwards
+        data = asdict(problem)
+        data["difficulty"] = problem.difficulty.level
 
         if submission:
-            data["submission"] = {
-                "id": submission.id,
-                "problem_id": submission.problem_id,
-                "language": submission.language,
-                "code": submission.code,
-                "status": submission.status.value,
-                "runtime": submission.runtime,
-                "memory": submission.memory,
-                "timestamp": submission.timestamp,
-                "percentiles": (
-                    {
-                        "runtime": submission.percentiles.runtime,
-                        "memory": submission.percentiles.memory,
-                    }
-                    if submission.percentiles
-                    else None
-                ),
-            }
+            submission_data = asdict(submission)
+            submission_data["status"] = submission.status.value
+            data["submission"] = submission_data
 
         return data
 
@@ -5,9 +5,11 @@ Used for testing API clients and adapters without making real HTTP requests.
 Covers common scenarios and edge cases as per Requirements 1.5.
 """
 
+from functools import lru_cache
 from typing import Any, Dict
 
 
+@lru_cache(maxsize=1)
 def get_leetcode_problem_response() -> Dict[str, Any]:
     """Mock LeetCode GraphQL API response for fetching a problem"""
     return {
@@ -57,6 +59,7 @@ def get_leetcode_problem_response() -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=1)
 def get_leetcode_submission_response() -> Dict[str, Any]:
     """Mock LeetCode API response for fetching a submission"""
     return {
@@ -87,6 +90,7 @@ def get_leetcode_submission_response() -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=1)
 def get_leetcode_user_profile_response() -> Dict[str, Any]:
     """Mock LeetCode API response for user profile"""
     return {
@@ -107,6 +111,7 @@ def get_leetcode_user_profile_response() -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=1)
 def get_leetcode_solved_problems_response() -> Dict[str, Any]:
     """Mock LeetCode API response for user's solved problems"""
     return {
@@ -130,6 +135,7 @@ def get_leetcode_solved_problems_response() -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=1)
 def get_leetcode_community_solutions_response() -> Dict[str, Any]:
     """Mock LeetCode API response for community solutions"""
     return {
@@ -156,11 +162,13 @@ def get_leetcode_community_solutions_response() -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=1)
 def get_leetcode_error_response() -> Dict[str, Any]:
     """Mock LeetCode API error response"""
     return {"errors": [{"message": "Question not found", "extensions": {"code": "NOT_FOUND"}}]}
 
 
+@lru_cache(maxsize=1)
 def get_leetcode_rate_limit_response() -> Dict[str, Any]:
     """Mock LeetCode API rate limit response"""
     return {
@@ -173,6 +181,7 @@ def get_leetcode_rate_limit_response() -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=1)
 def get_leetcode_authentication_error_response() -> Dict[str, Any]:
     """Mock LeetCode API authentication error response"""
     return {
@@ -185,6 +194,7 @@ def get_leetcode_authentication_error_response() -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=1)
 def get_hackerrank_problem_response() -> Dict[str, Any]:
     """Mock HackerRank API response for fetching a problem"""
     return {
@@ -206,6 +216,7 @@ def get_hackerrank_problem_response() -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=1)
 def get_hackerrank_submission_response() -> Dict[str, Any]:
     """Mock HackerRank API response for fetching a submission"""
     return {
@@ -222,6 +233,7 @@ def get_hackerrank_submission_response() -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=1)
 def get_codechef_problem_response() -> Dict[str, Any]:
     """Mock CodeChef API response for fetching a problem"""
     return {
@@ -247,6 +259,7 @@ def get_codechef_problem_response() -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=1)
 def get_codechef_submission_response() -> Dict[str, Any]:
     """Mock CodeChef API response for fetching a submission"""
     return {
@@ -268,6 +281,7 @@ def get_codechef_submission_response() -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=1)
 def get_codeforces_problem_response() -> Dict[str, Any]:
     """Mock Codeforces API response for fetching a problem"""
     return {
@@ -288,6 +302,7 @@ def get_codeforces_problem_response() -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=1)
 def get_codeforces_submission_response() -> Dict[str, Any]:
     """Mock Codeforces API response for fetching a submission"""
     return {
@@ -307,16 +322,19 @@ def get_codeforces_submission_response() -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=1)
 def get_empty_response() -> Dict[str, Any]:
     """Mock empty API response (edge case)"""
     return {"data": {}}
 
 
+@lru_cache(maxsize=1)
 def get_malformed_response() -> Dict[str, Any]:
     """Mock malformed API response (edge case)"""
     return {"unexpected_field": "unexpected_value", "missing": "expected_fields"}
 
 
+@lru_cache(maxsize=1)
 def get_partial_data_response() -> Dict[str, Any]:
     """Mock API response with partial/missing data (edge case)"""
     return {
@@ -331,11 +349,13 @@ def get_partial_data_response() -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=1)
 def get_network_timeout_response() -> Dict[str, Any]:
     """Mock response simulating network timeout (for testing error handling)"""
     return {"error": "Request timeout", "code": "TIMEOUT"}
 
 
+@lru_cache(maxsize=1)
 def get_server_error_response() -> Dict[str, Any]:
     """Mock 500 Internal Server Error response"""
     return {
@@ -345,6 +365,7 @@ def get_server_error_response() -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=1)
 def get_leetcode_problem_with_no_hints_response() -> Dict[str, Any]:
     """Mock LeetCode response for a problem with no hints (edge case)"""
     return {
@@ -376,6 +397,7 @@ def get_leetcode_problem_with_no_hints_response() -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=1)
 def get_leetcode_problem_with_many_examples_response() -> Dict[str, Any]:
     """Mock LeetCode response for a problem with many examples"""
     return {
@@ -416,6 +438,7 @@ def get_leetcode_problem_with_many_examples_response() -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=1)
 def get_leetcode_problem_with_html_content_response() -> Dict[str, Any]:
     """Mock LeetCode response with complex HTML content"""
     return {
@@ -0,0 +1,11 @@
+"""Shared fixtures for infrastructure unit tests."""
+
+import pytest
+
+from src.crawler.infrastructure.http import RetryConfig
+
+
+@pytest.fixture(scope="module")
+def default_retry_config():
+    """Default RetryConfig shared per module; frozen, so safe to reuse."""
+    return RetryConfig()
@@ -4,7 +4,6 @@ Unit tests for HTTPClient class.
 Tests retry logic, rate limiting integration, and error handling.
 """
 
-import logging
 from unittest.mock import Mock, patch
 
 import pytest
@@ -14,17 +13,48 @@ from src.crawler.domain.exceptions import NetworkException
 from src.crawler.infrastructure.http import HTTPClient, RateLimiter, RetryConfig
 
 
+class _FakeCallable:
+    """Minimal stand-in for a Mock method: counts calls, ignores arguments."""
+
+    def __init__(self):
+        self.call_count = 0
+
+    def __call__(self, *args, **kwargs):
+        self.call_count += 1
+
+
+class _FakeLogger:
+    """Lightweight logger fake; far cheaper to construct than Mock(spec=Logger)."""
+
+    def __init__(self):
+        self.debug = _FakeCallable()
+        self.info = _FakeCallable()
+        self.warning = _FakeCallable()
+        self.error = _FakeCallable()
+
+
+class _CountingRateLimiter:
+    """Rate limiter fake that records acquire() calls."""
+
+    def __init__(self):
+        self.acquire_count = 0
+
+    def acquire(self):
+        self.acquire_count += 1
+
+
 class TestHTTPClient:
     """Test suite for HTTPClient class."""
 
     @pytest.fixture
     def mock_logger(self):
-        """Create a mock logger for testing."""
-        return Mock(spec=logging.Logger)
+        """Create a fake logger for testing."""
+        return _FakeLogger()
 
-    @pytest.fixture
-    def retry_config(self):
-        """Create a retry config for testing."""
+    @pytest.fixture(scope="module")
+    @staticmethod
+    def retry_config():
+        """Create a retry config shared across the module (copy before mutating)."""
         return RetryConfig(
             max_retries=3,
             initial_delay=0.1,  # Short delay for faster tests
@@ -33,9 +63,10 @@ class TestHTTPClient:
             jitter=False,  # Disable jitter for predictable tests
         )
 
-    @pytest.fixture
-    def rate_limiter(self):
-        """Create a rate limiter for testing."""
+    @pytest.fixture(scope="module")
+    @staticmethod
+    def rate_limiter():
+        """Create a rate limiter shared across the module."""
         return RateLimiter(requests_per_second=100.0)  # High rate for fast tests
 
     @pytest.fixture
@@ -184,8 +215,8 @@ class TestHTTPClient:
     @patch("requests.Session.request")
     def test_rate_limiter_integration(self, mock_request, retry_config, mock_logger):
         """Test that rate limiter is called for each request."""
-        # Create a mock rate limiter
-        mock_rate_limiter = Mock(spec=RateLimiter)
+        # Create a counting rate limiter fake
+        mock_rate_limiter = _CountingRateLimiter()
         client = HTTPClient(retry_config, mock_rate_limiter, mock_logger)
 
         # Setup mock response
@@ -197,7 +228,7 @@ class TestHTTPClient:
         client.get("https://api.example.com/data")
 
         # Verify rate limiter was called
-        mock_rate_limiter.acquire.assert_called_once()
+        assert mock_rate_limiter.acquire_count == 1
 
     def test_calculate_delay_without_jitter(self, http_client):
         """Test delay calculation without jitter."""
@@ -212,9 +243,15 @@ class TestHTTPClient:
 
     def test_calculate_delay_with_jitter(self, retry_config, rate_limiter, mock_logger):
         """Test delay calculation with jitter."""
-        # Enable jitter
-        retry_config.jitter = True
-        client = HTTPClient(retry_config, rate_limiter, mock_logger)
+        # RetryConfig is frozen, so build a jitter-enabled one outright
+        jitter_config = RetryConfig(
+            max_retries=3,
+            initial_delay=0.1,
+            max_delay=1.0,
+            exponential_base=2.0,
+            jitter=True,
+        )
+        client = HTTPClient(jitter_config, rate_limiter, mock_logger)
 
         # Calculate delay multiple times
         delays = [client._calculate_delay(0) for _ in range(10)]
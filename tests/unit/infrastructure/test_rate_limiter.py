@@ -85,14 +85,16 @@ class TestRateLimiter:
         # Wait for tokens to refill beyond the rate
         time.sleep(2.0)
 
-        # Trigger refill calculation
+        # Trigger refill calculation (poking the scaled integer state the
+        # limiter uses internally)
         with limiter.lock:
-            now = time.time()
-            elapsed = now - limiter.last_update
-            limiter.tokens = min(
-                limiter.requests_per_second, limiter.tokens + elapsed * limiter.requests_per_second
+            now = time.monotonic_ns()
+            elapsed_ns = now - limiter._last_ns
+            limiter._tokens_scaled = min(
+                limiter._max_tokens_scaled,
+                limiter._tokens_scaled + int(elapsed_ns * limiter.requests_per_second),
             )
-            limiter.last_update = now
+            limiter._last_ns = now
 
         # Tokens should be capped at requests_per_second
         assert limiter.tokens <= limiter.requests_per_second
@@ -12,9 +12,9 @@ from src.crawler.infrastructure.http import RetryConfig
 class TestRetryConfig:
     """Test suite for RetryConfig dataclass."""
 
-    def test_default_values(self):
+    def test_default_values(self, default_retry_config):
         """Test that default values are set correctly."""
-        config = RetryConfig()
+        config = default_retry_config
 
         assert config.max_retries == 3
         assert config.initial_delay == 1.0
@@ -34,60 +34,69 @@ class TestRetryConfig:
         assert config.exponential_base == 3.0
         assert config.jitter is False
 
-    def test_negative_max_retries_raises_error(self):
-        """Test that negative max_retries raises ValueError."""
-        with pytest.raises(ValueError, match="max_retries must be non-negative"):
-            RetryConfig(max_retries=-1)
-
-    def test_zero_max_retries_is_valid(self):
-        """Test that zero max_retries is valid (no retries)."""
-        config = RetryConfig(max_retries=0)
-        assert config.max_retries == 0
-
-    def test_zero_initial_delay_raises_error(self):
-        """Test that zero initial_delay raises ValueError."""
-        with pytest.raises(ValueError, match="initial_delay must be positive"):
-            RetryConfig(initial_delay=0)
-
-    def test_negative_initial_delay_raises_error(self):
-        """Test that negative initial_delay raises ValueError."""
-        with pytest.raises(ValueError, match="initial_delay must be positive"):
-            RetryConfig(initial_delay=-1.0)
-
-    def test_zero_max_delay_raises_error(self):
-        """Test that zero max_delay raises ValueError."""
-        with pytest.raises(ValueError, match="max_delay must be positive"):
-            RetryConfig(max_delay=0)
-
-    def test_negative_max_delay_raises_error(self):
-        """Test that negative max_delay raises ValueError."""
-        with pytest.raises(ValueError, match="max_delay must be positive"):
-            RetryConfig(max_delay=-1.0)
-
-    def test_max_delay_less_than_initial_delay_raises_error(self):
-        """Test that max_delay < initial_delay raises ValueError."""
-        with pytest.raises(
-            ValueError, match="max_delay must be greater than or equal to initial_delay"
-        ):
-            RetryConfig(initial_delay=10.0, max_delay=5.0)
-
-    def test_max_delay_equal_to_initial_delay_is_valid(self):
-        """Test that max_delay == initial_delay is valid."""
-        config = RetryConfig(initial_delay=5.0, max_delay=5.0)
-        assert config.initial_delay == 5.0
-        assert config.max_delay == 5.0
-
-    def test_exponential_base_one_raises_error(self):
-        """Test that exponential_base == 1 raises ValueError."""
-        with pytest.raises(ValueError, match="exponential_base must be greater than 1"):
-            RetryConfig(exponential_base=1.0)
-
-    def test_exponential_base_less_than_one_raises_error(self):
-        """Test that exponential_base < 1 raises ValueError."""
-        with pytest.raises(ValueError, match="exponential_base must be greater than 1"):
-            RetryConfig(exponential_base=0.5)
-
-    def test_exponential_base_greater_than_one_is_valid(self):
-        """Test that exponential_base > 1 is valid."""
-        config = RetryConfig(exponential_base=1.5)
-        assert config.exponential_base == 1.5
+    @pytest.mark.parametrize(
+        "kwargs,match",
+        [
+            pytest.param(
+                {"max_retries": -1},
+                "max_retries must be non-negative",
+                id="negative-max-retries",
+            ),
+            pytest.param(
+                {"initial_delay": 0},
+                "initial_delay must be positive",
+                id="zero-initial-delay",
+            ),
+            pytest.param(
+                {"initial_delay": -1.0},
+                "initial_delay must be positive",
+                id="negative-initial-delay",
+            ),
+            pytest.param(
+                {"max_delay": 0},
+                "max_delay must be positive",
+                id="zero-max-delay",
+            ),
+            pytest.param(
+                {"max_delay": -1.0},
+                "max_delay must be positive",
+                id="negative-max-delay",
+            ),
+            pytest.param(
+                {"initial_delay": 10.0, "max_delay": 5.0},
+                "max_delay must be greater than or equal to initial_delay",
+                id="max-delay-below-initial-delay",
+            ),
+            pytest.param(
+                {"exponential_base": 1.0},
+                "exponential_base must be greater than 1",
+                id="exponential-base-of-one",
+            ),
+            pytest.param(
+                {"exponential_base": 0.5},
+                "exponential_base must be greater than 1",
+                id="exponential-base-below-one",
+            ),
+        ],
+    )
+    def test_invalid_values_raise_error(self, kwargs, match):
+        """Test that out-of-range values raise ValueError."""
+        with pytest.raises(ValueError, match=match):
+            RetryConfig(**kwargs)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            pytest.param({"max_retries": 0}, id="zero-max-retries-means-no-retries"),
+            pytest.param(
+                {"initial_delay": 5.0, "max_delay": 5.0}, id="max-delay-equal-to-initial-delay"
+            ),
+            pytest.param({"exponential_base": 1.5}, id="exponential-base-just-above-one"),
+        ],
+    )
+    def test_boundary_values_are_valid(self, kwargs):
+        """Test that boundary values construct successfully."""
+        config = RetryConfig(**kwargs)
+
+        for key, value in kwargs.items():
+            assert getattr(config, key) == value
@@ -2,7 +2,8 @@
 LeetCode Crawler Utilities
 """
 
+from .async_leetcode_client import AsyncLeetCodeClient
 from .formatters import clean_html, wrap_text
-from .leetcode_client import LeetCodeClient
+from .leetcode_client import LeetCodeClient, RetryConfig
 
-__all__ = ["LeetCodeClient", "clean_html", "wrap_text"]
+__all__ = ["AsyncLeetCodeClient", "LeetCodeClient", "RetryConfig", "clean_html", "wrap_text"]
@@ -0,0 +1,234 @@
+"""
+Async LeetCode API Client
+
+httpx-based counterpart to LeetCodeClient for fan-out workloads: many
+independent GraphQL fetches run concurrently on a single thread instead
+of one blocking round-trip at a time. Requires the optional httpx
+dependency (HTTP/2 multiplexing kicks in when the h2 extra is installed).
+"""
+
+import asyncio
+import logging
+from random import random as _random
+from typing import Dict, List, Optional
+
+try:
+    import httpx
+except ImportError:  # Optional; only the async client needs it
+    httpx = None
+
+try:
+    from .leetcode_client import (
+        _Q_COMMUNITY_SOLUTIONS,
+        _Q_OFFICIAL_SOLUTION,
+        _Q_QUESTION,
+        _Q_RECENT_AC,
+        _Q_USER_PROFILE,
+        _Q_USER_STATUS,
+        _TRANSIENT_STATUS_CODES,
+        GRAPHQL_URL,
+        RetryConfig,
+    )
+except ImportError:  # Running as a plain script directory, not a package
+    from utils.leetcode_client import (
+        _Q_COMMUNITY_SOLUTIONS,
+        _Q_OFFICIAL_SOLUTION,
+        _Q_QUESTION,
+        _Q_RECENT_AC,
+        _Q_USER_PROFILE,
+        _Q_USER_STATUS,
+        _TRANSIENT_STATUS_CODES,
+        GRAPHQL_URL,
+        RetryConfig,
+    )
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncLeetCodeClient:
+    """Async client for interacting with LeetCode API"""
+
+    def __init__(
+        self,
+        session_cookie: str = None,
+        csrf_token: str = None,
+        retry_config: RetryConfig = None,
+    ):
+        """
+        Initialize async LeetCode client with optional authentication
+
+        Args:
+            session_cookie: LEETCODE_SESSION cookie value from your browser
+            csrf_token: csrftoken cookie value from your browser
+            retry_config: Retry behavior for transient failures (defaults apply)
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncLeetCodeClient requires httpx (pip install httpx, "
+                "or httpx[http2] for HTTP/2 multiplexing)"
+            )
+
+        self.retry_config = retry_config or RetryConfig()
+
+        # Backoff ceilings are fixed for a given config; precompute them so
+        # a retry costs a table lookup plus the jitter draw
+        cfg = self.retry_config
+        self._delay_ceilings = tuple(
+            min(cfg.max_delay, cfg.initial_delay * cfg.exponential_base**attempt)
+            for attempt in range(cfg.max_retries)
+        )
+
+        headers = {
+            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate",
+            "Content-Type": "application/json",
+            "Referer": "https://leetcode.com",
+        }
+        cookies = httpx.Cookies()
+        if session_cookie:
+            cookies.set("LEETCODE_SESSION", session_cookie, domain=".leetcode.com")
+        if csrf_token:
+            cookies.set("csrftoken", csrf_token, domain=".leetcode.com")
+            headers["X-CSRFToken"] = csrf_token
+
+        self.authenticated = bool(session_cookie)
+
+        # Resolved lazily on first use; the session cookie pins the user
+        self._username: Optional[str] = None
+
+        limits = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+        try:
+            self._client = httpx.AsyncClient(
+                http2=True, limits=limits, timeout=30.0, headers=headers, cookies=cookies
+            )
+        except ImportError:
+            # h2 extra not installed; HTTP/1.1 with keep-alive still pools
+            self._client = httpx.AsyncClient(
+                limits=limits, timeout=30.0, headers=headers, cookies=cookies
+            )
+
+    async def aclose(self):
+        """Close the underlying connection pool"""
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    def _retry_delay(self, attempt: int) -> float:
+        """Backoff delay for a retry attempt, with full jitter when enabled"""
+        ceiling = self._delay_ceilings[attempt]
+        # _random() * ceiling is the same full-jitter draw as
+        # random.uniform(0, ceiling) minus a Python-level call
+        return _random() * ceiling if self.retry_config.jitter else ceiling
+
+    async def _post_graphql(self, query: str, variables: Dict = None) -> Dict:
+        """
+        POST a GraphQL query, retrying transient failures with backoff
+
+        Same policy as the sync client: retries transport errors and
+        429/5xx responses with full-jitter exponential backoff, honoring
+        a Retry-After header; other errors raise immediately.
+        """
+        payload = {"query": query}
+        if variables is not None:
+            payload["variables"] = variables
+
+        max_retries = self.retry_config.max_retries
+        for attempt in range(max_retries + 1):
+            try:
+                response = await self._client.post(GRAPHQL_URL, json=payload)
+            except httpx.TransportError:
+                if attempt >= max_retries:
+                    raise
+                await asyncio.sleep(self._retry_delay(attempt))
+                continue
+
+            if response.status_code in _TRANSIENT_STATUS_CODES and attempt < max_retries:
+                delay = self._retry_delay(attempt)
+                retry_after = response.headers.get("Retry-After")
+                if retry_after:
+                    try:
+                        delay = max(delay, float(retry_after))
+                    except ValueError:
+                        pass
+                await asyncio.sleep(delay)
+                continue
+
+            response.raise_for_status()
+            return response.json()
+
+    async def fetch_problem_graphql(self, title_slug: str) -> Optional[Dict]:
+        """Fetch problem data using LeetCode's GraphQL API"""
+        try:
+            data = await self._post_graphql(_Q_QUESTION, {"titleSlug": title_slug})
+            return data.get("data", {}).get("question")
+        except Exception as e:
+            logger.warning("Error fetching problem data: %s", e)
+            return None
+
+    async def fetch_many_problems(self, slugs: List[str]) -> Dict[str, Optional[Dict]]:
+        """Fetch many problems concurrently; returns slug -> problem data"""
+        results = await asyncio.gather(*(self.fetch_problem_graphql(slug) for slug in slugs))
+        return dict(zip(slugs, results))
+
+    async def fetch_user_profile(self, username: str = None) -> Optional[Dict]:
+        """Fetch user profile data"""
+        try:
+            if username:
+                data = await self._post_graphql(_Q_USER_PROFILE, {"username": username})
+                return data.get("data", {}).get("matchedUser")
+            data = await self._post_graphql(_Q_USER_STATUS)
+            return data.get("data", {}).get("userStatus")
+        except Exception as e:
+            logger.warning("Error fetching user profile: %s", e)
+            return None
+
+    async def _resolve_username(self) -> Optional[str]:
+        """Current user's username, fetched once and cached for the session"""
+        if self._username is None:
+            profile = await self.fetch_user_profile()
+            if profile:
+                self._username = profile.get("username")
+        return self._username
+
+    async def fetch_solved_problems(
+        self, username: str = None, limit: int = 100
+    ) -> Optional[List[Dict]]:
+        """Fetch list of solved problems for a user"""
+        # Get current username if not provided (cached after the first lookup)
+        if not username:
+            username = await self._resolve_username()
+            if not username:
+                return None
+
+        try:
+            data = await self._post_graphql(_Q_RECENT_AC, {"username": username, "limit": limit})
+            return data.get("data", {}).get("recentAcSubmissionList", [])
+        except Exception as e:
+            logger.warning("Error fetching solved problems: %s", e)
+            return None
+
+    async def fetch_solution_articles(self, title_slug: str) -> Optional[List[Dict]]:
+        """Fetch community solution articles"""
+        try:
+            data = await self._post_graphql(
+                _Q_COMMUNITY_SOLUTIONS,
+                {"questionSlug": title_slug, "skip": 0, "first": 10, "orderBy": "hot"},
+            )
+            return data.get("data", {}).get("questionSolutions", {}).get("solutions", [])
+        except Exception as e:
+            logger.warning("Error fetching solutions: %s", e)
+            return None
+
+    async def fetch_official_solution(self, title_slug: str) -> Optional[Dict]:
+        """Fetch official LeetCode solution (requires premium)"""
+        try:
+            data = await self._post_graphql(_Q_OFFICIAL_SOLUTION, {"titleSlug": title_slug})
+            return data.get("data", {}).get("question", {}).get("solution")
+        except Exception as e:
+            logger.warning("Error fetching official solution: %s", e)
+            return None
@@ -2,27 +2,198 @@
 LeetCode API Client
 """
 
-from typing import Dict, List, Optional
+import gzip
+import json
+import logging
+import os
+import re
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from random import random as _random
+from typing import Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson as _json
+except ImportError:  # orjson is optional for the v1 scripts
+    import json as _json
+
+try:
+    from .formatters import clean_html
+except ImportError:  # Running as a plain script directory, not a package
+    from utils.formatters import clean_html
+
+logger = logging.getLogger(__name__)
+
+GRAPHQL_URL = "https://leetcode.com/graphql"
+
+# Compiled once; extract_problem_slug runs per crawled URL
+_SLUG_RE = re.compile(r"/problems/([^/]+)")
+
+# Responses worth retrying: rate limiting and transient server errors.
+# Anything else (401, 404, ...) fails immediately
+_TRANSIENT_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# (connect, read) timeouts so a hanging socket doesn't block the pool
+_REQUEST_TIMEOUT = (5, 30)
+
+# In-memory cache bound; the disk cache is only bounded by its TTL
+_MEMORY_CACHE_MAX_ENTRIES = 4096
+
+# Field selection for a question, shared by single and batched fetches
+_QUESTION_FIELDS = (
+    "questionId questionFrontendId title titleSlug content difficulty likes dislikes "
+    "categoryTitle topicTags{name slug} codeSnippets{lang langSlug code} stats hints "
+    "solution{id canSeeDetail paidOnly hasVideoSolution paidOnlyVideo} exampleTestcases"
+)
+
+
+_Q_QUESTION = (
+    "query questionData($titleSlug: String!) "
+    f"{{question(titleSlug: $titleSlug) {{{_QUESTION_FIELDS}}}}}"
+)
+
+_Q_USER_STATUS = "query globalData {userStatus {username isSignedIn isPremium avatar}}"
+
+_Q_USER_PROFILE = (
+    "query userPublicProfile($username: String!) {matchedUser(username: $username) "
+    "{username profile {realName userAvatar reputation ranking} "
+    "submitStats {acSubmissionNum {difficulty count}}}}"
+)
+
+_Q_RECENT_AC = (
+    "query recentAcSubmissions($username: String!, $limit: Int!) "
+    "{recentAcSubmissionList(username: $username, limit: $limit) "
+    "{id title titleSlug timestamp}}"
+)
+
+_Q_PROBLEMSET = (
+    "query problemsetQuestionList($categorySlug: String, $limit: Int, $skip: Int, "
+    "$filters: QuestionListFilterInput) {problemsetQuestionList: questionList("
+    "categorySlug: $categorySlug limit: $limit skip: $skip filters: $filters) "
+    "{total: totalNum questions: data {acRate difficulty freqBar "
+    "frontendQuestionId: questionFrontendId isFavor paidOnly: isPaidOnly status "
+    "title titleSlug topicTags {name id slug}}}}"
+)
+
+_Q_COMMUNITY_SOLUTIONS = (
+    "query communitySolutions($questionSlug: String!, $skip: Int!, $first: Int!, "
+    "$orderBy: TopicSortingOption) {questionSolutions(filters: {questionSlug: $questionSlug, "
+    "skip: $skip, first: $first, orderBy: $orderBy}) {hasDirectResults totalNum solutions "
+    "{id title commentCount topLevelCommentCount viewCount pinned isFavorite "
+    "solutionTags {name slug} post {id status voteCount creationDate isHidden "
+    "author {username isActive profile {userAvatar reputation}} content contentTypeId}}}}"
+)
+
+# (output key, source key, transform) rows for parse_problem's flat fields;
+# topics, stats and code_snippets need their own shaping and stay inline
+_PARSE_FIELDS = (
+    ("id", "questionFrontendId", None),
+    ("title", "title", None),
+    ("difficulty", "difficulty", None),
+    ("description", "content", clean_html),
+    ("likes", "likes", None),
+    ("dislikes", "dislikes", None),
+    ("example_testcases", "exampleTestcases", None),
+)
+
+_Q_SUBMISSION_LIST = (
+    "query submissionList($offset: Int!, $limit: Int!, $questionSlug: String!, $status: Int) "
+    "{questionSubmissionList(offset: $offset, limit: $limit, questionSlug: $questionSlug, "
+    "status: $status) {submissions {id statusDisplay lang runtime memory timestamp}}}"
+)
+
+_Q_OFFICIAL_SOLUTION = (
+    "query officialSolution($titleSlug: String!) {question(titleSlug: $titleSlug) "
+    "{solution {id title content contentTypeId paidOnly hasVideoSolution paidOnlyVideo "
+    "canSeeDetail rating {count average}}}}"
+)
+
+
+@dataclass(frozen=True)
+class RetryConfig:
+    """Retry behavior for transient API failures (mirrors the v2 config)"""
+
+    max_retries: int = 3
+    initial_delay: float = 1.0
+    max_delay: float = 60.0
+    exponential_base: float = 2.0
+    jitter: bool = True
+
+    def __post_init__(self):
+        if self.max_retries < 0:
+            raise ValueError("max_retries must be non-negative")
+        if self.initial_delay <= 0:
+            raise ValueError("initial_delay must be positive")
+        if self.max_delay <= 0:
+            raise ValueError("max_delay must be positive")
+        if self.max_delay < self.initial_delay:
+            raise ValueError("max_delay must be greater than or equal to initial_delay")
+        if self.exponential_base <= 1:
+            raise ValueError("exponential_base must be greater than 1")
 
 
 class LeetCodeClient:
     """Client for interacting with LeetCode API"""
 
-    def __init__(self, session_cookie: str = None, csrf_token: str = None):
+    def __init__(
+        self,
+        session_cookie: str = None,
+        csrf_token: str = None,
+        retry_config: RetryConfig = None,
+        cache: bool = True,
+        cache_dir: str = None,
+        cache_max_age_seconds: float = 86400.0,
+    ):
         """
         Initialize LeetCode client with optional authentication
 
         Args:
             session_cookie: LEETCODE_SESSION cookie value from your browser
             csrf_token: csrftoken cookie value from your browser
+            retry_config: Retry behavior for transient failures (defaults apply)
+            cache: Cache read-only fetches in memory and on disk (pass False
+                to always hit the network, e.g. in tests)
+            cache_dir: Disk cache location (default ~/.cache/leetcode_crawler)
+            cache_max_age_seconds: Ignore disk entries older than this
         """
+        self.retry_config = retry_config or RetryConfig()
+
+        # Backoff ceilings are fixed for a given config; precompute them so
+        # a retry costs a table lookup plus the jitter draw
+        cfg = self.retry_config
+        self._delay_ceilings = tuple(
+            min(cfg.max_delay, cfg.initial_delay * cfg.exponential_base**attempt)
+            for attempt in range(cfg.max_retries)
+        )
+
+        self._cache_enabled = cache
+        self._cache_dir = cache_dir or os.path.join(
+            os.path.expanduser("~"), ".cache", "leetcode_crawler"
+        )
+        self._cache_max_age = cache_max_age_seconds
+        self._memory_cache = OrderedDict()
+
+        # Resolved lazily on first use; the session cookie pins the user,
+        # so one profile round-trip covers every later call
+        self._username: Optional[str] = None
         self.session = requests.Session()
+
+        # Reuse keep-alive connections across calls; bulk crawls otherwise
+        # pay a fresh TLS handshake per request
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
                 "Accept": "application/json",
+                "Accept-Encoding": "gzip, deflate",
                 "Content-Type": "application/json",
                 "Referer": "https://leetcode.com",
             }
@@ -39,213 +210,222 @@ class LeetCodeClient:
 
     def extract_problem_slug(self, url: str) -> str:
         """Extract problem slug from URL"""
-        import re
-
-        match = re.search(r"/problems/([^/]+)", url)
+        match = _SLUG_RE.search(url)
         return match.group(1) if match else ""
 
-    def fetch_problem_graphql(self, title_slug: str) -> Optional[Dict]:
-        """Fetch problem data using LeetCode's GraphQL API"""
-        graphql_url = "https://leetcode.com/graphql"
-
-        query = """
-        query questionData($titleSlug: String!) {
-            question(titleSlug: $titleSlug) {
-                questionId
-                questionFrontendId
-                title
-                titleSlug
-                content
-                difficulty
-                likes
-                dislikes
-                categoryTitle
-                topicTags {
-                    name
-                    slug
-                }
-                codeSnippets {
-                    lang
-                    langSlug
-                    code
-                }
-                stats
-                hints
-                solution {
-                    id
-                    canSeeDetail
-                    paidOnly
-                    hasVideoSolution
-                    paidOnlyVideo
-                }
-                exampleTestcases
-            }
-        }
+    def _retry_delay(self, attempt: int) -> float:
+        """Backoff delay for a retry attempt, with full jitter when enabled"""
+        ceiling = self._delay_ceilings[attempt]
+        # _random() * ceiling is the same full-jitter draw as
+        # random.uniform(0, ceiling) minus a Python-level call
+        return _random() * ceiling if self.retry_config.jitter else ceiling
+
+    def _post_graphql(self, query: str, variables: Dict = None) -> Dict:
         """
+        POST a GraphQL query, retrying transient failures with backoff
 
-        payload = {"query": query, "variables": {"titleSlug": title_slug}}
+        Retries connection errors, timeouts and 429/5xx responses up to
+        max_retries times, honoring a Retry-After header when the server
+        sends one. Unrecoverable responses (401, 404, ...) raise immediately.
+        """
+        payload = {"query": query}
+        if variables is not None:
+            payload["variables"] = variables
+
+        max_retries = self.retry_config.max_retries
+        for attempt in range(max_retries + 1):
+            try:
+                response = self.session.post(GRAPHQL_URL, json=payload, timeout=_REQUEST_TIMEOUT)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if attempt >= max_retries:
+                    raise
+                time.sleep(self._retry_delay(attempt))
+                continue
+
+            if response.status_code in _TRANSIENT_STATUS_CODES and attempt < max_retries:
+                delay = self._retry_delay(attempt)
+                retry_after = response.headers.get("Retry-After")
+                if retry_after:
+                    try:
+                        delay = max(delay, float(retry_after))
+                    except ValueError:
+                        pass
+                time.sleep(delay)
+                continue
 
-        try:
-            response = self.session.post(graphql_url, json=payload)
             response.raise_for_status()
-            data = response.json()
+            # orjson parses the raw bytes several times faster than
+            # response.json(), and problem-set pages run to megabytes
+            return _json.loads(response.content)
+
+    def _memory_cache_insert(self, key: Tuple[str, str], value) -> None:
+        """Insert into the in-memory cache, evicting the oldest entry if full"""
+        self._memory_cache[key] = value
+        if len(self._memory_cache) > _MEMORY_CACHE_MAX_ENTRIES:
+            self._memory_cache.popitem(last=False)
+
+    def _cached_fetch(self, kind: str, slug: str, fetch):
+        """
+        Memoize a read-only fetch in memory and on disk
+
+        Responses persist to <cache_dir>/<kind>-<slug>.json.gz, so repeat
+        crawler runs (and offline parse_problem re-runs) skip the network
+        entirely. Stale disk entries past the TTL fall through to the fetch.
+        """
+        if not self._cache_enabled:
+            return fetch(slug)
+
+        key = (kind, slug)
+        if key in self._memory_cache:
+            self._memory_cache.move_to_end(key)
+            return self._memory_cache[key]
+
+        path = os.path.join(self._cache_dir, f"{kind}-{slug}.json.gz")
+        try:
+            if time.time() - os.stat(path).st_mtime <= self._cache_max_age:
+                with gzip.open(path, "rb") as f:
+                    value = _json.loads(f.read())
+                self._memory_cache_insert(key, value)
+                return value
+        except (OSError, ValueError):
+            pass  # Missing, stale or corrupt entry; refetch
+
+        value = fetch(slug)
+        if value is not None:
+            try:
+                os.makedirs(self._cache_dir, exist_ok=True)
+                with gzip.open(path, "wb") as f:
+                    f.write(json.dumps(value).encode("utf-8"))
+            except OSError:
+                pass  # Cache writes are best-effort
+            self._memory_cache_insert(key, value)
+        return value
+
+    def fetch_problem_graphql(self, title_slug: str) -> Optional[Dict]:
+        """Fetch problem data using LeetCode's GraphQL API"""
+        return self._cached_fetch("problem", title_slug, self._fetch_problem_uncached)
+
+    def _fetch_problem_uncached(self, title_slug: str) -> Optional[Dict]:
+        """Fetch problem data straight from the GraphQL API"""
+        try:
+            data = self._post_graphql(_Q_QUESTION, {"titleSlug": title_slug})
             return data.get("data", {}).get("question")
         except Exception as e:
-            print(f"Error fetching problem data: {e}")
+            logger.warning("Error fetching problem data: %s", e)
             return None
 
+    def fetch_problems_batch(self, slugs: List[str], batch_size: int = 20) -> Dict[str, Dict]:
+        """
+        Fetch several problems with one GraphQL request per batch
+
+        GraphQL aliasing folds up to batch_size question sub-queries into a
+        single POST, so one round-trip replaces batch_size of them. Batches
+        the server rejects fall back to per-slug fetches.
+        """
+        results = {}
+
+        for start in range(0, len(slugs), batch_size):
+            batch = slugs[start : start + batch_size]
+            params = ", ".join(f"$s{i}: String!" for i in range(len(batch)))
+            selections = " ".join(
+                f"q{i}: question(titleSlug: $s{i}) {{{_QUESTION_FIELDS}}}"
+                for i in range(len(batch))
+            )
+            query = f"query problemsBatch({params}) {{{selections}}}"
+            variables = {f"s{i}": slug for i, slug in enumerate(batch)}
+
+            try:
+                data = self._post_graphql(query, variables)
+            except Exception as e:
+                logger.warning("Error fetching problem batch: %s", e)
+                data = None
+
+            if not data or data.get("errors"):
+                # Batch too complex or partially rejected; fetch individually
+                for slug in batch:
+                    results[slug] = self.fetch_problem_graphql(slug)
+                continue
+
+            payload = data.get("data", {})
+            for i, slug in enumerate(batch):
+                results[slug] = payload.get(f"q{i}")
+
+        return results
+
     def fetch_user_profile(self, username: str = None) -> Optional[Dict]:
         """Fetch user profile data"""
-        graphql_url = "https://leetcode.com/graphql"
-
-        # If no username provided, get current user
-        if not username:
-            query = """
-            query globalData {
-                userStatus {
-                    username
-                    isSignedIn
-                    isPremium
-                    avatar
-                }
-            }
-            """
-            payload = {"query": query}
-        else:
-            query = """
-            query userPublicProfile($username: String!) {
-                matchedUser(username: $username) {
-                    username
-                    profile {
-                        realName
-                        userAvatar
-                        reputation
-                        ranking
-                    }
-                    submitStats {
-                        acSubmissionNum {
-                            difficulty
-                            count
-                        }
-                    }
-                }
-            }
-            """
-            payload = {"query": query, "variables": {"username": username}}
+        # If no username provided, query the current user's status instead
+        variables = {"username": username} if username else None
 
         try:
-            response = self.session.post(graphql_url, json=payload)
-            response.raise_for_status()
-            data = response.json()
+            data = self._post_graphql(_Q_USER_PROFILE if username else _Q_USER_STATUS, variables)
 
             if username:
                 return data.get("data", {}).get("matchedUser")
             else:
                 return data.get("data", {}).get("userStatus")
         except Exception as e:
-            print(f"Error fetching user profile: {e}")
+            logger.warning("Error fetching user profile: %s", e)
             return None
 
+    def _resolve_username(self) -> Optional[str]:
+        """Current user's username, fetched once and cached for the session"""
+        if self._username is None:
+            profile = self.fetch_user_profile()
+            if profile:
+                self._username = profile.get("username")
+        return self._username
+
     def fetch_solved_problems(
         self, username: str = None, limit: int = 100, skip: int = 0
     ) -> Optional[List[Dict]]:
         """Fetch list of solved problems for a user"""
-        graphql_url = "https://leetcode.com/graphql"
-
-        # Get current username if not provided
+        # Get current username if not provided (cached after the first lookup)
         if not username:
-            profile = self.fetch_user_profile()
-            if not profile:
+            username = self._resolve_username()
+            if not username:
                 return None
-            username = profile.get("username")
-
-        query = """
-        query recentAcSubmissions($username: String!, $limit: Int!) {
-            recentAcSubmissionList(username: $username, limit: $limit) {
-                id
-                title
-                titleSlug
-                timestamp
-            }
-        }
-        """
-
-        payload = {"query": query, "variables": {"username": username, "limit": limit}}
 
         try:
-            response = self.session.post(graphql_url, json=payload)
-            response.raise_for_status()
-            data = response.json()
+            data = self._post_graphql(_Q_RECENT_AC, {"username": username, "limit": limit})
             return data.get("data", {}).get("recentAcSubmissionList", [])
         except Exception as e:
-            print(f"Error fetching solved problems: {e}")
+            logger.warning("Error fetching solved problems: %s", e)
             return None
 
+    def _fetch_problem_page(self, skip: int, limit: int) -> Tuple[int, List[Dict]]:
+        """Fetch one page of the problem set; returns (total, questions)"""
+        data = self._post_graphql(
+            _Q_PROBLEMSET, {"categorySlug": "", "skip": skip, "limit": limit, "filters": {}}
+        )
+
+        question_list = data.get("data", {}).get("problemsetQuestionList", {})
+        return question_list.get("total", 0), question_list.get("questions", [])
+
     def fetch_all_problems_with_status(self) -> Optional[List[Dict]]:
         """Fetch all problems with user's solve status"""
-        graphql_url = "https://leetcode.com/graphql"
-
-        query = """
-        query problemsetQuestionList($categorySlug: String, $limit: Int, $skip: Int, $filters: QuestionListFilterInput) {
-            problemsetQuestionList: questionList(
-                categorySlug: $categorySlug
-                limit: $limit
-                skip: $skip
-                filters: $filters
-            ) {
-                total: totalNum
-                questions: data {
-                    acRate
-                    difficulty
-                    freqBar
-                    frontendQuestionId: questionFrontendId
-                    isFavor
-                    paidOnly: isPaidOnly
-                    status
-                    title
-                    titleSlug
-                    topicTags {
-                        name
-                        id
-                        slug
-                    }
-                }
-            }
-        }
-        """
-
-        all_questions = []
-        skip = 0
         limit = 100
 
         try:
-            while True:
-                payload = {
-                    "query": query,
-                    "variables": {"categorySlug": "", "skip": skip, "limit": limit, "filters": {}},
-                }
-
-                response = self.session.post(graphql_url, json=payload)
-                response.raise_for_status()
-                data = response.json()
-
-                question_list = data.get("data", {}).get("problemsetQuestionList", {})
-                questions = question_list.get("questions", [])
-                total = question_list.get("total", 0)
-
-                if not questions:
-                    break
-
-                all_questions.extend(questions)
-                skip += limit
-
-                # Stop if we've fetched all questions
-                if skip >= total:
-                    break
+            # The first page tells us the total, after which the remaining
+            # pages are independent and can be fetched concurrently
+            total, all_questions = self._fetch_problem_page(0, limit)
+
+            if not all_questions:
+                return []
+
+            remaining = range(limit, total, limit)
+            if remaining:
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    # map preserves input order, so pages land in sequence
+                    for _, questions in executor.map(
+                        lambda skip: self._fetch_problem_page(skip, limit), remaining
+                    ):
+                        all_questions.extend(questions)
 
             return all_questions
         except Exception as e:
-            print(f"Error fetching all problems: {e}")
+            logger.warning("Error fetching all problems: %s", e)
             return None
 
     def fetch_my_submissions(self, title_slug: str, limit: int = 20) -> Optional[List[Dict]]:
@@ -255,11 +435,11 @@ class LeetCodeClient:
         try:
             response = self.session.get(url, params={"limit": limit, "offset": 0})
             response.raise_for_status()
-            data = response.json()
+            data = _json.loads(response.content)
             submissions = data.get("submissions_dump", [])
             return submissions
         except Exception as e:
-            print(f"Error fetching submissions: {e}")
+            logger.warning("Error fetching submissions: %s", e)
             return None
 
     def fetch_submission_detail(self, submission_id: str) -> Optional[Dict]:
@@ -269,110 +449,78 @@ class LeetCodeClient:
         try:
             response = self.session.get(url)
             response.raise_for_status()
-            data = response.json()
-            return data
+            return _json.loads(response.content)
         except Exception as e:
             return None
 
     def fetch_solution_articles(self, title_slug: str) -> Optional[List[Dict]]:
         """Fetch community solution articles"""
-        graphql_url = "https://leetcode.com/graphql"
-
-        query = """
-        query communitySolutions($questionSlug: String!, $skip: Int!, $first: Int!, $orderBy: TopicSortingOption) {
-            questionSolutions(
-                filters: {questionSlug: $questionSlug, skip: $skip, first: $first, orderBy: $orderBy}
-            ) {
-                hasDirectResults
-                totalNum
-                solutions {
-                    id
-                    title
-                    commentCount
-                    topLevelCommentCount
-                    viewCount
-                    pinned
-                    isFavorite
-                    solutionTags {
-                        name
-                        slug
-                    }
-                    post {
-                        id
-                        status
-                        voteCount
-                        creationDate
-                        isHidden
-                        author {
-                            username
-                            isActive
-                            profile {
-                                userAvatar
-                                reputation
-                            }
-                        }
-                        content
-                        contentTypeId
-                    }
-                }
-            }
-        }
-        """
-
-        payload = {
-            "query": query,
-            "variables": {"questionSlug": title_slug, "skip": 0, "first": 10, "orderBy": "hot"},
-        }
+        return self._cached_fetch("solutions", title_slug, self._fetch_solution_articles_uncached)
 
+    def _fetch_solution_articles_uncached(self, title_slug: str) -> Optional[List[Dict]]:
+        """Fetch community solution articles straight from the GraphQL API"""
         try:
-            response = self.session.post(graphql_url, json=payload)
-            response.raise_for_status()
-            data = response.json()
+            data = self._post_graphql(
+                _Q_COMMUNITY_SOLUTIONS,
+                {"questionSlug": title_slug, "skip": 0, "first": 10, "orderBy": "hot"},
+            )
             solutions = data.get("data", {}).get("questionSolutions", {}).get("solutions", [])
             return solutions
         except Exception as e:
-            print(f"Error fetching solutions: {e}")
+            logger.warning("Error fetching solutions: %s", e)
             return None
 
     def fetch_official_solution(self, title_slug: str) -> Optional[Dict]:
         """Fetch official LeetCode solution (requires premium)"""
-        graphql_url = "https://leetcode.com/graphql"
-
-        query = """
-        query officialSolution($titleSlug: String!) {
-            question(titleSlug: $titleSlug) {
-                solution {
-                    id
-                    title
-                    content
-                    contentTypeId
-                    paidOnly
-                    hasVideoSolution
-                    paidOnlyVideo
-                    canSeeDetail
-                    rating {
-                        count
-                        average
-                    }
-                }
-            }
-        }
-        """
-
-        payload = {"query": query, "variables": {"titleSlug": title_slug}}
+        return self._cached_fetch("official", title_slug, self._fetch_official_solution_uncached)
 
+    def _fetch_official_solution_uncached(self, title_slug: str) -> Optional[Dict]:
+        """Fetch the official solution straight from the GraphQL API"""
         try:
-            response = self.session.post(graphql_url, json=payload)
-            response.raise_for_status()
-            data = response.json()
+            data = self._post_graphql(_Q_OFFICIAL_SOLUTION, {"titleSlug": title_slug})
             return data.get("data", {}).get("question", {}).get("solution")
         except Exception as e:
-            print(f"Error fetching official solution: {e}")
+            logger.warning("Error fetching official solution: %s", e)
             return None
 
+    def _fetch_accepted_submissions(self, title_slug: str) -> Optional[List[Dict]]:
+        """
+        Fetch accepted submissions for a problem, cheapest path first
+
+        Asks GraphQL for a single accepted submission (status 10) instead of
+        downloading a page of submission bodies just to scan for the first
+        "Accepted" in Python. Falls back to the REST dump when GraphQL
+        rejects the filter (e.g. unauthenticated).
+        """
+        try:
+            data = self._post_graphql(
+                _Q_SUBMISSION_LIST,
+                {"offset": 0, "limit": 1, "questionSlug": title_slug, "status": 10},
+            )
+            if not data.get("errors"):
+                submission_list = data.get("data", {}).get("questionSubmissionList") or {}
+                submissions = submission_list.get("submissions")
+                if submissions is not None:
+                    # Normalize to the REST dump's snake_case shape
+                    return [
+                        {
+                            "id": s.get("id"),
+                            "status_display": s.get("statusDisplay", "Accepted"),
+                            "lang": s.get("lang"),
+                            "runtime": s.get("runtime"),
+                            "memory": s.get("memory"),
+                            "timestamp": s.get("timestamp"),
+                        }
+                        for s in submissions
+                    ]
+        except Exception as e:
+            logger.warning("Error fetching accepted submission list: %s", e)
+
+        return self.fetch_my_submissions(title_slug)
+
     def get_last_accepted_submission(self, title_slug: str) -> Optional[Dict]:
         """Get the last accepted submission for a problem"""
-        submissions = self.fetch_my_submissions(title_slug)
+        submissions = self._fetch_accepted_submissions(title_slug)
 
         if not submissions:
             return None
@@ -407,40 +555,61 @@ class LeetCodeClient:
 
         return None
 
+    def fetch_problem_bundle(self, title_slug: str, include_my_submission: bool = True) -> Dict:
+        """
+        Fetch a problem and its solutions in parallel and parse the result
+
+        The problem, official solution, community solutions and (when
+        authenticated) the last accepted submission are independent
+        requests; issuing them together costs roughly one round-trip of
+        wall time instead of three or four back to back.
+        """
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            problem_future = executor.submit(self.fetch_problem_graphql, title_slug)
+            official_future = executor.submit(self.fetch_official_solution, title_slug)
+            solutions_future = executor.submit(self.fetch_solution_articles, title_slug)
+            submission_future = None
+            if include_my_submission and self.authenticated:
+                submission_future = executor.submit(self.get_last_accepted_submission, title_slug)
+
+            problem_data = problem_future.result()
+            official_solution = official_future.result()
+            solutions = solutions_future.result()
+            my_submission = submission_future.result() if submission_future else None
+
+        return self.parse_problem(problem_data, solutions, official_solution, my_submission)
+
     def parse_problem(
         self,
         problem_data: Dict,
         solutions: List[Dict] = None,
         official_solution: Dict = None,
         my_submission: Dict = None,
+        include_stats: bool = True,
     ) -> Dict:
-        """Parse and format problem data"""
-        import json
-
-        from utils.formatters import clean_html
+        """
+        Parse and format problem data
 
+        Pass include_stats=False on bulk crawls that don't need acceptance
+        numbers; the stats field arrives as a JSON string inside the JSON
+        response and costs a second parse per problem.
+        """
         if not problem_data:
             return {}
 
-        # Parse stats
-        stats = json.loads(problem_data.get("stats", "{}"))
-
         result = {
-            "id": problem_data.get("questionFrontendId"),
-            "title": problem_data.get("title"),
-            "difficulty": problem_data.get("difficulty"),
-            "description": clean_html(problem_data.get("content", "")),
-            "topics": [tag["name"] for tag in problem_data.get("topicTags", [])],
-            "likes": problem_data.get("likes"),
-            "dislikes": problem_data.get("dislikes"),
-            "acceptance_rate": stats.get("acRate"),
-            "total_accepted": stats.get("totalAcceptedRaw"),
-            "total_submissions": stats.get("totalSubmissionRaw"),
-            "hints": problem_data.get("hints", []),
-            "example_testcases": problem_data.get("exampleTestcases"),
-            "code_snippets": {
-                snippet["lang"]: snippet["code"] for snippet in problem_data.get("codeSnippets", [])
-            },
+            out: fn(problem_data.get(key, "")) if fn else problem_data.get(key)
+            for out, key, fn in _PARSE_FIELDS
+        }
+        result["topics"] = [tag["name"] for tag in problem_data.get("topicTags", [])]
+        if include_stats:
+            stats = _json.loads(problem_data.get("stats") or "{}")
+            result["acceptance_rate"] = stats.get("acRate")
+            result["total_accepted"] = stats.get("totalAcceptedRaw")
+            result["total_submissions"] = stats.get("totalSubmissionRaw")
+        result["hints"] = problem_data.get("hints", [])
+        result["code_snippets"] = {
+            snippet["lang"]: snippet["code"] for snippet in problem_data.get("codeSnippets", [])
         }
 
         # Add my submission if available